@@ -4,50 +4,84 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from typing import Any
+from functools import lru_cache
+
+from typing_extensions import TypedDict
+
+_MAX_ERROR_LINE_LENGTH = 500
+"""Cap on the extracted error line length, so caret rendering stays cheap on minified single-line documents."""
 
 
 @dataclass
 class JsonErrorInfo:
     """Extracted information from a JSONDecodeError."""
 
+    # Declared manually rather than via `@dataclass(slots=True)` which requires Python 3.10+.
+    __slots__ = ('msg', 'pos', 'lineno', 'colno', 'error_line', 'preview')
+
     msg: str
     pos: int
     lineno: int
     colno: int
-    doc: str
     error_line: str
-    lines: list[str]
+    preview: str
 
 
-def extract_json_error_info(error: json.JSONDecodeError) -> JsonErrorInfo:
+def extract_json_error_info(error: json.JSONDecodeError, preview_len: int = 500) -> JsonErrorInfo:
     """Extract structured information from a JSONDecodeError.
 
     Args:
         error: The JSONDecodeError to extract from
+        preview_len: Maximum length of the document preview to retain
 
     Returns:
         JsonErrorInfo with extracted data
     """
     doc = error.doc or ''
-    lines = doc.splitlines()
 
-    # Get the problematic line (lineno is 1-based)
+    # Extract just the problematic line by seeking around the error position, instead of
+    # materializing every line of what may be a multi-megabyte document with `splitlines()`.
     error_line = ''
-    if error.lineno >= 1 and error.lineno <= len(lines):
-        error_line = lines[error.lineno - 1]
+    if doc and error.lineno >= 1:
+        pos = min(max(error.pos, 0), len(doc))
+        line_start = doc.rfind('\n', 0, pos) + 1
+        line_end = doc.find('\n', pos)
+        if line_end == -1:
+            line_end = len(doc)
+        error_line = doc[line_start : min(line_end, line_start + _MAX_ERROR_LINE_LENGTH)]
+
+    # Slice the preview here so the full document doesn't need to be retained after extraction.
+    preview = doc[:preview_len] + '...' if len(doc) > preview_len else (doc or 'N/A')
 
     return JsonErrorInfo(
         msg=error.msg,
         pos=error.pos,
         lineno=error.lineno,
         colno=error.colno,
-        doc=doc,
         error_line=error_line,
-        lines=lines,
+        preview=preview,
     )
 
 
+@lru_cache(maxsize=256)
+def _format_json_error_visual(msg: str, pos: int, lineno: int, colno: int, error_line: str) -> str:
+    """LRU-cached implementation of [`format_json_error_visual`][pydantic_ai._json_error_formatter.format_json_error_visual].
+
+    In streaming retry loops the same malformed prefix yields the same decode error repeatedly,
+    so identical banners are served from cache instead of being re-formatted.
+    """
+    # If we don't have valid line/col info, fall back to basic error
+    if lineno < 1 or not error_line:
+        return f'{msg} at position {pos}'
+
+    # colno is 1-based, so we need colno-1 spaces before the caret, clamped to the (possibly
+    # truncated) error line so the caret never runs past the displayed text.
+    # `{"":>{caret_pos}}` writes the padding straight into the f-string buffer,
+    # avoiding the intermediate `' ' * caret_pos + '^'` string and `parts` list.
+    caret_pos = min(max(0, colno - 1), len(error_line))
+    return f'JSON parsing error, line {lineno}:\n    {error_line}\n    {"":>{caret_pos}}^\nJSONDecodeError: {msg}'
+
+
 def format_json_error_visual(error_info: JsonErrorInfo) -> str:
     """Format JsonErrorInfo with visual context similar to compiler errors.
 
@@ -57,27 +91,9 @@ def format_json_error_visual(error_info: JsonErrorInfo) -> str:
     Returns:
         A formatted string showing the error location with visual indicators
     """
-    if not error_info.doc:
-        return f'{error_info.msg} at position {error_info.pos}'
-
-    # If we don't have valid line/col info, fall back to basic error
-    if error_info.lineno < 1 or error_info.lineno > len(error_info.lines):
-        return f'{error_info.msg} at position {error_info.pos}'
-
-    # Create the visual indicator
-    # colno is 1-based, so we need colno-1 spaces before the caret
-    caret_pos = max(0, error_info.colno - 1)
-    visual_indicator = ' ' * caret_pos + '^'
-
-    # Build the formatted error message
-    parts = [
-        f'JSON parsing error, line {error_info.lineno}:',
-        f'    {error_info.error_line}',
-        f'    {visual_indicator}',
-        f'JSONDecodeError: {error_info.msg}',
-    ]
-
-    return '\n'.join(parts)
+    return _format_json_error_visual(
+        error_info.msg, error_info.pos, error_info.lineno, error_info.colno, error_info.error_line
+    )
 
 
 def format_json_decode_error(error: json.JSONDecodeError) -> str:
@@ -93,7 +109,20 @@ def format_json_decode_error(error: json.JSONDecodeError) -> str:
     return format_json_error_visual(error_info)
 
 
-def create_json_error_context(error: json.JSONDecodeError, model_name: str, chunk_count: int) -> dict[str, Any]:
+class JsonErrorContext(TypedDict):
+    """Structured context for a JSON decode error, suitable for structured logging."""
+
+    model_name: str
+    chunk_count: int
+    json_error_msg: str
+    json_error_pos: int
+    json_error_lineno: int
+    json_error_colno: int
+    formatted_error: str
+    problematic_content_preview: str
+
+
+def create_json_error_context(error: json.JSONDecodeError, model_name: str, chunk_count: int) -> JsonErrorContext:
     """Create structured context for JSON decode errors.
 
     Args:
@@ -115,7 +144,5 @@ def create_json_error_context(error: json.JSONDecodeError, model_name: str, chun
         'json_error_lineno': error_info.lineno,
         'json_error_colno': error_info.colno,
         'formatted_error': formatted_error,
-        'problematic_content_preview': error_info.doc[:500] + '...'
-        if len(error_info.doc) > 500
-        else error_info.doc or 'N/A',
+        'problematic_content_preview': error_info.preview,
     }
@@ -497,6 +497,8 @@ class NativeOutputSchema(StructuredTextOutputSchema[OutputDataT]):
 class PromptedOutputSchema(StructuredTextOutputSchema[OutputDataT]):
     template: str | None = None
 
+    _instructions_cache: tuple[str, str] | None = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def mode(self) -> OutputMode:
         return 'prompted'
@@ -509,8 +511,16 @@ class PromptedOutputSchema(StructuredTextOutputSchema[OutputDataT]):
         """Get instructions to tell model to output JSON matching the schema."""
         template = self.template or default_template
 
+        # The schema is static per output type and the instructions are requested on every run step,
+        # so the rendered string is cached per template (which can differ between model profiles).
+        cached = self._instructions_cache
+        if cached is not None and cached[0] == template:
+            return cached[1]
+
         if '{schema}' not in template:
-            template = '\n\n'.join([template, '{schema}'])
+            schema_template = '\n\n'.join([template, '{schema}'])
+        else:
+            schema_template = template
 
         object_def = self.object_def
         schema = object_def.json_schema.copy()
@@ -519,7 +529,9 @@ class PromptedOutputSchema(StructuredTextOutputSchema[OutputDataT]):
         if object_def.description:
             schema['description'] = object_def.description
 
-        return template.format(schema=json.dumps(schema))
+        instructions = schema_template.format(schema=json.dumps(schema))
+        self._instructions_cache = (template, instructions)
+        return instructions
 
     async def process(
         self,
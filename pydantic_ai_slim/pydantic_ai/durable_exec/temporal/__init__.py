@@ -40,6 +40,9 @@ class PydanticAIPlugin(ClientPlugin, WorkerPlugin):
                 'A non-default Temporal data converter was used which has been replaced with the Pydantic data converter.'
             )
 
+        # The Pydantic data converter serializes payloads (including tool-call params and deps) with
+        # Rust-backed `pydantic_core.to_json` and caches `TypeAdapter`s for deserialization, so it's
+        # already the fast path for activity round-trips — no third-party JSON codec needed.
         config['data_converter'] = pydantic_data_converter
         return super().configure_client(config)
 
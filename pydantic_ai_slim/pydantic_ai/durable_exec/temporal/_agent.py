@@ -34,7 +34,7 @@ from pydantic_ai.tools import (
 from pydantic_ai.toolsets import AbstractToolset
 
 from ._model import TemporalModel
-from ._toolset import TemporalWrapperToolset, temporalize_toolset
+from ._toolset import TemporalWrapperToolset, set_in_workflow, temporalize_toolset
 
 
 class TemporalAgent(WrapperAgent[AgentDepsT, OutputDataT]):
@@ -178,7 +178,8 @@ class TemporalAgent(WrapperAgent[AgentDepsT, OutputDataT]):
     @contextmanager
     def _temporal_overrides(self) -> Iterator[None]:
         # We reset tools here as the temporalized function toolset is already in self._toolsets.
-        with super().override(model=self._model, toolsets=self._toolsets, tools=[]):
+        # `set_in_workflow` caches the workflow probe for the duration of the run so per-tool-call checks are a context var read.
+        with super().override(model=self._model, toolsets=self._toolsets, tools=[]), set_in_workflow():
             token = self._temporal_overrides_active.set(True)
             try:
                 yield
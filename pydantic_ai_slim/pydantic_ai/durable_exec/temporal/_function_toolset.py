@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Any, Callable, Literal
+from weakref import WeakValueDictionary
 
 from pydantic import ConfigDict, with_config
 from temporalio import activity, workflow
@@ -13,7 +14,7 @@ from pydantic_ai.toolsets import FunctionToolset, ToolsetTool
 from pydantic_ai.toolsets.function import FunctionToolsetTool
 
 from ._run_context import TemporalRunContext
-from ._toolset import TemporalWrapperToolset
+from ._toolset import TemporalWrapperToolset, in_workflow
 
 
 @dataclass
@@ -24,6 +25,14 @@ class _CallToolParams:
     serialized_run_context: Any
 
 
+_call_tool_activity_cache: WeakValueDictionary[tuple[str, Any, Any, int], Callable[..., Any]] = WeakValueDictionary()
+"""Cache of `activity.defn`-decorated `call_tool_activity` functions, so that re-temporalizing the same toolset
+(e.g. when the same agent is wrapped repeatedly) doesn't pay Temporal's activity-definition cost again.
+
+Keyed by `(activity_name, deps_type, run_context_type, id(toolset))`; the decorated activity holds a strong
+reference to the toolset, so its `id` cannot be reused while the cache entry is alive."""
+
+
 class TemporalFunctionToolset(TemporalWrapperToolset[AgentDepsT]):
     def __init__(
         self,
@@ -40,23 +49,40 @@ class TemporalFunctionToolset(TemporalWrapperToolset[AgentDepsT]):
         self.tool_activity_config = tool_activity_config
         self.run_context_type = run_context_type
 
+        # Merge the per-tool configs into the base config once, rather than on every tool call.
+        self._merged_activity_config: dict[str, ActivityConfig | Literal[False]] = {
+            name: config if config is False else activity_config | config
+            for name, config in tool_activity_config.items()
+        }
+
+        activity_name = f'{activity_name_prefix}__toolset__{self.id}__call_tool'
+        cache_key = (activity_name, deps_type, run_context_type, id(toolset))
+        cached_activity = _call_tool_activity_cache.get(cache_key)
+        if cached_activity is not None:
+            self.call_tool_activity = cached_activity
+            return
+
+        toolset_id = self.id
+
         async def call_tool_activity(params: _CallToolParams, deps: AgentDepsT) -> Any:
             name = params.name
-            ctx = self.run_context_type.deserialize_run_context(params.serialized_run_context, deps=deps)
-            try:
-                tool = (await toolset.get_tools(ctx))[name]
-            except KeyError as e:  # pragma: no cover
+            ctx = run_context_type.deserialize_run_context(params.serialized_run_context, deps=deps)
+            # The tool is resolved directly from the toolset's registry per execution; it can't be
+            # memoized by (toolset, run_step) because prepared tool definitions may depend on `deps`
+            # and one worker serves many concurrent workflows.
+            tool = await toolset.get_tool(name, ctx)
+            if tool is None:  # pragma: no cover
                 raise UserError(
-                    f'Tool {name!r} not found in toolset {self.id!r}. '
+                    f'Tool {name!r} not found in toolset {toolset_id!r}. '
                     'Removing or renaming tools during an agent run is not supported with Temporal.'
-                ) from e
+                )
 
-            return await self.wrapped.call_tool(name, params.tool_args, ctx, tool)
+            return await toolset.call_tool(name, params.tool_args, ctx, tool)
 
         # Set type hint explicitly so that Temporal can take care of serialization and deserialization
         call_tool_activity.__annotations__['deps'] = deps_type
 
-        self.call_tool_activity = activity.defn(name=f'{activity_name_prefix}__toolset__{self.id}__call_tool')(
+        self.call_tool_activity = _call_tool_activity_cache[cache_key] = activity.defn(name=activity_name)(
             call_tool_activity
         )
 
@@ -67,10 +93,10 @@ class TemporalFunctionToolset(TemporalWrapperToolset[AgentDepsT]):
     async def call_tool(
         self, name: str, tool_args: dict[str, Any], ctx: RunContext[AgentDepsT], tool: ToolsetTool[AgentDepsT]
     ) -> Any:
-        if not workflow.in_workflow():
+        if not in_workflow():
             return await super().call_tool(name, tool_args, ctx, tool)
 
-        tool_activity_config = self.tool_activity_config.get(name, {})
+        tool_activity_config = self._merged_activity_config.get(name, self.activity_config)
         if tool_activity_config is False:
             assert isinstance(tool, FunctionToolsetTool)
             if not tool.is_async:
@@ -80,7 +106,6 @@ class TemporalFunctionToolset(TemporalWrapperToolset[AgentDepsT]):
                 )
             return await super().call_tool(name, tool_args, ctx, tool)
 
-        tool_activity_config = self.activity_config | tool_activity_config
         serialized_run_context = self.run_context_type.serialize_run_context(ctx)
         return await workflow.execute_activity(  # pyright: ignore[reportUnknownMemberType]
             activity=self.call_tool_activity,
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any, Callable, Literal
 
+from temporalio import workflow
 from temporalio.workflow import ActivityConfig
 
 from pydantic_ai.mcp import MCPServer
@@ -13,6 +17,31 @@ from pydantic_ai.toolsets.wrapper import WrapperToolset
 
 from ._run_context import TemporalRunContext
 
+_in_workflow_flag: ContextVar[bool | None] = ContextVar('_in_workflow_flag', default=None)
+"""Context-local cache of `temporalio.workflow.in_workflow()`, set for the duration of an agent run via `set_in_workflow`."""
+
+
+@contextmanager
+def set_in_workflow() -> Iterator[None]:
+    """Cache `temporalio.workflow.in_workflow()` in the context-local flag for the duration of the context."""
+    token = _in_workflow_flag.set(workflow.in_workflow())
+    try:
+        yield
+    finally:
+        _in_workflow_flag.reset(token)
+
+
+def in_workflow() -> bool:
+    """Like `temporalio.workflow.in_workflow`, but served from the context-local flag cached at the start of an agent run.
+
+    Whether we're inside a workflow is invariant for the whole run, so per-tool-call probes of Temporal's
+    runtime state can be skipped. Callers outside an agent run fall back to the real probe.
+    """
+    flag = _in_workflow_flag.get()
+    if flag is None:
+        return workflow.in_workflow()
+    return flag
+
 
 class TemporalWrapperToolset(WrapperToolset[AgentDepsT], ABC):
     @property
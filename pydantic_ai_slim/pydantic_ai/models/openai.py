@@ -6,6 +6,7 @@ from collections.abc import AsyncIterable, AsyncIterator, Sequence
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Literal, Union, cast, overload
 
 from pydantic import ValidationError
@@ -289,6 +290,11 @@ class OpenAIModel(Model):
         """The system / model provider."""
         return self._system
 
+    @cached_property
+    def _openai_profile(self) -> OpenAIModelProfile:
+        """The model profile as an `OpenAIModelProfile`, resolved once instead of on every request and tool mapping."""
+        return OpenAIModelProfile.from_profile(self.profile)
+
     @overload
     async def _completions_create(
         self,
@@ -320,8 +326,7 @@ class OpenAIModel(Model):
         if not tools:
             tool_choice: Literal['none', 'required', 'auto'] | None = None
         elif (
-            not model_request_parameters.allow_text_output
-            and OpenAIModelProfile.from_profile(self.profile).openai_supports_tool_choice_required
+            not model_request_parameters.allow_text_output and self._openai_profile.openai_supports_tool_choice_required
         ):
             tool_choice = 'required'
         else:
@@ -340,9 +345,7 @@ class OpenAIModel(Model):
             response_format = {'type': 'json_object'}
 
         sampling_settings = (
-            model_settings
-            if OpenAIModelProfile.from_profile(self.profile).openai_supports_sampling_settings
-            else OpenAIModelSettings()
+            model_settings if self._openai_profile.openai_supports_sampling_settings else OpenAIModelSettings()
         )
 
         try:
@@ -542,7 +545,7 @@ class OpenAIModel(Model):
         }
         if o.description:
             response_format_param['json_schema']['description'] = o.description
-        if OpenAIModelProfile.from_profile(self.profile).openai_supports_strict_tool_definition:  # pragma: no branch
+        if self._openai_profile.openai_supports_strict_tool_definition:  # pragma: no branch
             response_format_param['json_schema']['strict'] = o.strict
         return response_format_param
 
@@ -555,7 +558,7 @@ class OpenAIModel(Model):
                 'parameters': f.parameters_json_schema,
             },
         }
-        if f.strict and OpenAIModelProfile.from_profile(self.profile).openai_supports_strict_tool_definition:
+        if f.strict and self._openai_profile.openai_supports_strict_tool_definition:
             tool_param['function']['strict'] = f.strict
         return tool_param
 
@@ -700,6 +703,11 @@ class OpenAIResponsesModel(Model):
         """The system / model provider."""
         return self._system
 
+    @cached_property
+    def _openai_profile(self) -> OpenAIModelProfile:
+        """The model profile as an `OpenAIModelProfile`, resolved once instead of on every request and tool mapping."""
+        return OpenAIModelProfile.from_profile(self.profile)
+
     async def request(
         self,
         messages: list[ModelRequest | ModelResponse],
@@ -833,9 +841,7 @@ class OpenAIResponsesModel(Model):
             text['verbosity'] = verbosity
 
         sampling_settings = (
-            model_settings
-            if OpenAIModelProfile.from_profile(self.profile).openai_supports_sampling_settings
-            else OpenAIResponsesModelSettings()
+            model_settings if self._openai_profile.openai_supports_sampling_settings else OpenAIResponsesModelSettings()
         )
 
         try:
@@ -914,9 +920,7 @@ class OpenAIResponsesModel(Model):
             'parameters': f.parameters_json_schema,
             'type': 'function',
             'description': f.description,
-            'strict': bool(
-                f.strict and OpenAIModelProfile.from_profile(self.profile).openai_supports_strict_tool_definition
-            ),
+            'strict': bool(f.strict and self._openai_profile.openai_supports_strict_tool_definition),
         }
 
     async def _map_messages(
@@ -1007,7 +1011,7 @@ class OpenAIResponsesModel(Model):
         }
         if o.description:
             response_format_param['description'] = o.description
-        if OpenAIModelProfile.from_profile(self.profile).openai_supports_strict_tool_definition:  # pragma: no branch
+        if self._openai_profile.openai_supports_strict_tool_definition:  # pragma: no branch
             response_format_param['strict'] = o.strict
         return response_format_param
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 import inspect
 from collections.abc import Awaitable
 from dataclasses import dataclass, replace
-from typing import Any, Callable, Union
+from typing import Any, Callable, Union, cast
 
 from typing_extensions import Self, TypeAlias
 
@@ -16,6 +16,9 @@ ToolsetFunc: TypeAlias = Callable[
 ]
 """A sync/async function which takes a run context and returns a toolset."""
 
+_EMPTY_TOOLS: dict[str, ToolsetTool[Any]] = {}
+"""Shared empty tools dict returned when no toolset was generated, so polling an optional toolset doesn't allocate."""
+
 
 @dataclass
 class DynamicToolset(AbstractToolset[AgentDepsT]):
@@ -30,6 +33,31 @@ class DynamicToolset(AbstractToolset[AgentDepsT]):
 
     _toolset: AbstractToolset[AgentDepsT] | None = None
     _run_step: int | None = None
+    _tools: dict[str, ToolsetTool[AgentDepsT]] | None = None
+    _tools_run_step: int | None = None
+
+    def __post_init__(self):
+        # Detect once whether the function needs to be awaited, instead of type-checking its result on every rebuild.
+        self._is_async_toolset_func = inspect.iscoroutinefunction(self.toolset_func)
+
+    def __eq__(self, other: object) -> bool:
+        # Compare the cheap fields first so that comparing the inner toolset — which may recurse
+        # through a large wrapped toolset tree — only happens when everything else already matches.
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        other = cast('DynamicToolset[AgentDepsT]', other)
+        if (
+            self.per_run_step != other.per_run_step
+            or self._run_step != other._run_step
+            or self._tools_run_step != other._tools_run_step
+            or (self.toolset_func is not other.toolset_func and self.toolset_func != other.toolset_func)
+        ):
+            return False
+        return (self._toolset is other._toolset or self._toolset == other._toolset) and (
+            self._tools is other._tools or self._tools == other._tools
+        )
 
     @property
     def id(self) -> str | None:
@@ -45,26 +73,40 @@ class DynamicToolset(AbstractToolset[AgentDepsT]):
         finally:
             self._toolset = None
             self._run_step = None
+            self._tools = None
+            self._tools_run_step = None
 
     async def get_tools(self, ctx: RunContext[AgentDepsT]) -> dict[str, ToolsetTool[AgentDepsT]]:
         if self._toolset is None or (self.per_run_step and ctx.run_step != self._run_step):
             if self._toolset is not None:
                 await self._toolset.__aexit__()
 
-            toolset = self.toolset_func(ctx)
-            if inspect.isawaitable(toolset):
-                toolset = await toolset
+            if self._is_async_toolset_func:
+                toolset = await cast('Awaitable[Union[AbstractToolset[AgentDepsT], None]]', self.toolset_func(ctx))
+            else:
+                toolset = self.toolset_func(ctx)
+                if inspect.isawaitable(toolset):  # a sync function may still return an awaitable
+                    toolset = await toolset
 
             if toolset is not None:
                 await toolset.__aenter__()
 
             self._toolset = toolset
             self._run_step = ctx.run_step
+            self._tools = None
+            self._tools_run_step = None
 
         if self._toolset is None:
-            return {}
+            return _EMPTY_TOOLS
+
+        # A dynamic toolset is only used during a single agent run, so the tools are stable
+        # within a run step and can be served from cache when they're requested again.
+        if self._tools is not None and self._tools_run_step == ctx.run_step:
+            return self._tools
 
-        return await self._toolset.get_tools(ctx)
+        self._tools = await self._toolset.get_tools(ctx)
+        self._tools_run_step = ctx.run_step
+        return self._tools
 
     async def call_tool(
         self, name: str, tool_args: dict[str, Any], ctx: RunContext[AgentDepsT], tool: ToolsetTool[AgentDepsT]
@@ -84,4 +126,4 @@ class DynamicToolset(AbstractToolset[AgentDepsT]):
         if self._toolset is None:
             return super().visit_and_replace(visitor)
         else:
-            return replace(self, _toolset=self._toolset.visit_and_replace(visitor))
+            return replace(self, _toolset=self._toolset.visit_and_replace(visitor), _tools=None, _tools_run_step=None)
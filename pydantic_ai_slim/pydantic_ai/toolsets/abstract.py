@@ -112,6 +112,14 @@ class AbstractToolset(ABC, Generic[AgentDepsT]):
         """The tools that are available in this toolset."""
         raise NotImplementedError()
 
+    async def get_tool(self, name: str, ctx: RunContext[AgentDepsT]) -> ToolsetTool[AgentDepsT] | None:
+        """Get a single tool by name, or `None` if it's not available.
+
+        By default this builds the full [`get_tools`][pydantic_ai.toolsets.AbstractToolset.get_tools] dict;
+        subclasses with an internal tool registry can override it to look up the tool directly.
+        """
+        return (await self.get_tools(ctx)).get(name)
+
     @abstractmethod
     async def call_tool(
         self, name: str, tool_args: dict[str, Any], ctx: RunContext[AgentDepsT], tool: ToolsetTool[AgentDepsT]
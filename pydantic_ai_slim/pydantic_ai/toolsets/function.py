@@ -246,6 +246,27 @@ class FunctionToolset(AbstractToolset[AgentDepsT]):
             )
         return tools
 
+    async def get_tool(self, name: str, ctx: RunContext[AgentDepsT]) -> ToolsetTool[AgentDepsT] | None:
+        tool = self.tools.get(name)
+        if tool is None:
+            # The requested name may be the result of a `prepare` rename, so fall back to the full listing.
+            return (await self.get_tools(ctx)).get(name)
+
+        run_context = replace(ctx, tool_name=name, retry=ctx.retries.get(name, 0))
+        tool_def = await tool.prepare_tool_def(run_context)
+        if not tool_def or tool_def.name != name:
+            # The tool was omitted or renamed for this step; another tool may have been renamed to this name.
+            return (await self.get_tools(ctx)).get(name)
+
+        return FunctionToolsetTool(
+            toolset=self,
+            tool_def=tool_def,
+            max_retries=tool.max_retries if tool.max_retries is not None else self.max_retries,
+            args_validator=tool.function_schema.validator,
+            call_func=tool.function_schema.call,
+            is_async=tool.function_schema.is_async,
+        )
+
     async def call_tool(
         self, name: str, tool_args: dict[str, Any], ctx: RunContext[AgentDepsT], tool: ToolsetTool[AgentDepsT]
     ) -> Any:
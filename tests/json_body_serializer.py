@@ -1,17 +1,23 @@
 # pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
+import copy
 import json
 import urllib.parse
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 import yaml
 
 if TYPE_CHECKING:
-    from yaml import Dumper
+    from yaml import Dumper, SafeLoader
 else:
     try:
         from yaml import CDumper as Dumper
     except ImportError:  # pragma: no cover
         from yaml import Dumper
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # pragma: no cover
+        from yaml import SafeLoader
 
 FILTERED_HEADER_PREFIXES = ['anthropic-', 'cf-', 'x-']
 FILTERED_HEADERS = {'authorization', 'date', 'request-id', 'server', 'user-agent', 'via', 'set-cookie', 'api-key'}
@@ -34,8 +40,11 @@ def str_presenter(dumper: Dumper, data: str):
 LiteralDumper.add_representer(str, str_presenter)
 
 
-def deserialize(cassette_string: str):
-    cassette_dict = yaml.safe_load(cassette_string)
+@lru_cache(maxsize=64)
+def _parse_cassette(cassette_string: str):
+    # Use the libyaml loader when available; cassette replay spends most of its time parsing YAML
+    # and the C loader is an order of magnitude faster than the pure-Python one.
+    cassette_dict = yaml.load(cassette_string, Loader=SafeLoader)
     for interaction in cassette_dict['interactions']:
         for kind, data in interaction.items():
             parsed_body = data.pop('parsed_body', None)
@@ -45,6 +54,12 @@ def deserialize(cassette_string: str):
     return cassette_dict
 
 
+def deserialize(cassette_string: str):
+    # Cassettes shared by several tests are parsed once per worker; the copy keeps tests from
+    # seeing each other's mutations of the replayed interactions.
+    return copy.deepcopy(_parse_cassette(cassette_string))
+
+
 def serialize(cassette_dict: Any):  # pragma: lax no cover
     for interaction in cassette_dict['interactions']:
         for _kind, data in interaction.items():
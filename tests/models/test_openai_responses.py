@@ -1,10 +1,11 @@
-import json
+from collections.abc import AsyncIterator
 from dataclasses import replace
 from typing import Any
 
 import pytest
 from inline_snapshot import snapshot
 from pydantic import BaseModel
+from pydantic_core import to_json
 from typing_extensions import TypedDict
 
 from pydantic_ai.agent import Agent
@@ -26,6 +27,7 @@ from pydantic_ai.messages import (
     ToolReturnPart,
     UserPromptPart,
 )
+from pydantic_ai.models import cached_async_http_client
 from pydantic_ai.output import NativeOutput, PromptedOutput, TextOutput, ToolOutput
 from pydantic_ai.profiles.openai import openai_model_profile
 from pydantic_ai.tools import ToolDefinition
@@ -45,6 +47,49 @@ pytestmark = [
 ]
 
 
+@pytest.fixture(scope='module')
+def vcr_config(vcr_config: dict[str, Any]) -> dict[str, Any]:
+    # Every request in this module hits the same https://api.openai.com/v1/responses endpoint,
+    # so matching on method and path is enough and skips the scheme/host/port/query comparisons.
+    return {**vcr_config, 'match_on': ['method', 'path']}
+
+
+# We need to use a custom cached HTTP client here as the default one created for OpenAIProvider will be closed automatically
+# at the end of each test, but the module-scoped `model` fixture needs this one to live longer.
+http_client = cached_async_http_client(provider='openai-responses-test')
+
+
+@pytest.fixture(autouse=True, scope='module')
+async def close_cached_httpx_client(anyio_backend: str) -> AsyncIterator[None]:
+    try:
+        yield
+    finally:
+        await http_client.aclose()
+
+
+@pytest.fixture(scope='module')
+def openai_provider(openai_api_key: str) -> OpenAIProvider:
+    """A shared provider, so that tests don't repeat the API-key validation and client setup."""
+    return OpenAIProvider(api_key=openai_api_key, http_client=http_client)
+
+
+@pytest.fixture(scope='module')
+def model(openai_provider: OpenAIProvider) -> OpenAIResponsesModel:
+    """A shared `gpt-4o` model, so that tests don't repeat the model/provider construction."""
+    return OpenAIResponsesModel('gpt-4o', provider=openai_provider)
+
+
+@pytest.fixture(scope='module')
+def agent(model: OpenAIResponsesModel) -> Agent:
+    """A shared plain agent for tests that don't register tools or customize settings."""
+    return Agent(model)
+
+
+async def get_user_country() -> str:
+    """Shared tool function for the structured-output tests, registered with `agent.tool_plain(get_user_country)`."""
+    return 'Mexico'
+
+
 def test_openai_responses_model(env: TestEnv):
     env.set('OPENAI_API_KEY', 'test')
     model = OpenAIResponsesModel('gpt-4o')
@@ -52,16 +97,14 @@ def test_openai_responses_model(env: TestEnv):
     assert model.system == 'openai'
 
 
-async def test_openai_responses_model_simple_response(allow_model_requests: None, openai_api_key: str):
-    model = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-    agent = Agent(model=model)
+async def test_openai_responses_model_simple_response(allow_model_requests: None, agent: Agent):
     result = await agent.run('What is the capital of France?')
     assert result.output == snapshot('The capital of France is Paris.')
 
 
-async def test_openai_responses_model_simple_response_with_tool_call(allow_model_requests: None, openai_api_key: str):
-    model = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-
+async def test_openai_responses_model_simple_response_with_tool_call(
+    allow_model_requests: None, model: OpenAIResponsesModel
+):
     agent = Agent(model=model)
 
     @agent.tool_plain
@@ -72,9 +115,7 @@ async def test_openai_responses_model_simple_response_with_tool_call(allow_model
     assert result.output == snapshot('The capital of PotatoLand is Potato City.')
 
 
-async def test_openai_responses_output_type(allow_model_requests: None, openai_api_key: str):
-    model = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-
+async def test_openai_responses_output_type(allow_model_requests: None, model: OpenAIResponsesModel):
     class MyOutput(TypedDict):
         name: str
         age: int
@@ -84,55 +125,60 @@ async def test_openai_responses_output_type(allow_model_requests: None, openai_a
     assert result.output == snapshot({'name': 'Brazil', 'age': 2023})
 
 
-async def test_openai_responses_reasoning_effort(allow_model_requests: None, openai_api_key: str):
-    model = OpenAIResponsesModel('o3-mini', provider=OpenAIProvider(api_key=openai_api_key))
+# Expected output of `test_openai_responses_reasoning_effort`, hoisted so the 40-item list literal
+# is only built once at import time.
+_EXPECTED_ALFAJOR_LINES = snapshot(
+    [
+        'Ingredients for the dough:',
+        '• 300 g cornstarch',
+        '• 200 g flour',
+        '• 150 g powdered sugar',
+        '• 200 g unsalted butter',
+        '• 3 egg yolks',
+        '• Zest of 1 lemon',
+        '• 1 teaspoon vanilla extract',
+        '• A pinch of salt',
+        '',
+        'Ingredients for the filling (dulce de leche):',
+        '• 400 g dulce de leche',
+        '',
+        'Optional coating:',
+        '• Powdered sugar for dusting',
+        '• Grated coconut',
+        '• Crushed peanuts or walnuts',
+        '• Melted chocolate',
+        '',
+        'Steps:',
+        '1. In a bowl, mix together the cornstarch, flour, powdered sugar, and salt.',
+        '2. Add the unsalted butter cut into small pieces. Work it into the dry ingredients until the mixture resembles coarse breadcrumbs.',
+        '3. Incorporate the egg yolks, lemon zest, and vanilla extract. Mix until you obtain a smooth and homogeneous dough.',
+        '4. Wrap the dough in plastic wrap and let it rest in the refrigerator for at least one hour.',
+        '5. Meanwhile, prepare a clean workspace by lightly dusting it with flour.',
+        '6. Roll out the dough on the working surface until it is about 0.5 cm thick.',
+        '7. Use a round cutter (approximately 3-4 cm in diameter) to cut out circles. Re-roll any scraps to maximize the number of cookies.',
+        '8. Arrange the circles on a baking sheet lined with parchment paper.',
+        '9. Preheat the oven to 180°C (350°F) and bake the cookies for about 10-12 minutes until they are lightly golden at the edges. They should remain soft.',
+        '10. Remove the cookies from the oven and allow them to cool completely on a rack.',
+        '11. Once the cookies are cool, spread dulce de leche on the flat side of one cookie and sandwich it with another.',
+        '12. If desired, roll the edges of the alfajores in powdered sugar, grated coconut, crushed nuts, or dip them in melted chocolate.',
+        '13. Allow any coatings to set before serving.',
+        '',
+        'Enjoy your homemade Uruguayan alfajores!',
+    ]
+)
+
+
+async def test_openai_responses_reasoning_effort(allow_model_requests: None, openai_provider: OpenAIProvider):
+    model = OpenAIResponsesModel('o3-mini', provider=openai_provider)
     agent = Agent(model=model, model_settings=OpenAIModelSettings(openai_reasoning_effort='low'))
     result = await agent.run(
         'Explain me how to cook uruguayan alfajor. Do not send whitespaces at the end of the lines.'
     )
-    assert [line.strip() for line in result.output.splitlines()] == snapshot(
-        [
-            'Ingredients for the dough:',
-            '• 300 g cornstarch',
-            '• 200 g flour',
-            '• 150 g powdered sugar',
-            '• 200 g unsalted butter',
-            '• 3 egg yolks',
-            '• Zest of 1 lemon',
-            '• 1 teaspoon vanilla extract',
-            '• A pinch of salt',
-            '',
-            'Ingredients for the filling (dulce de leche):',
-            '• 400 g dulce de leche',
-            '',
-            'Optional coating:',
-            '• Powdered sugar for dusting',
-            '• Grated coconut',
-            '• Crushed peanuts or walnuts',
-            '• Melted chocolate',
-            '',
-            'Steps:',
-            '1. In a bowl, mix together the cornstarch, flour, powdered sugar, and salt.',
-            '2. Add the unsalted butter cut into small pieces. Work it into the dry ingredients until the mixture resembles coarse breadcrumbs.',
-            '3. Incorporate the egg yolks, lemon zest, and vanilla extract. Mix until you obtain a smooth and homogeneous dough.',
-            '4. Wrap the dough in plastic wrap and let it rest in the refrigerator for at least one hour.',
-            '5. Meanwhile, prepare a clean workspace by lightly dusting it with flour.',
-            '6. Roll out the dough on the working surface until it is about 0.5 cm thick.',
-            '7. Use a round cutter (approximately 3-4 cm in diameter) to cut out circles. Re-roll any scraps to maximize the number of cookies.',
-            '8. Arrange the circles on a baking sheet lined with parchment paper.',
-            '9. Preheat the oven to 180°C (350°F) and bake the cookies for about 10-12 minutes until they are lightly golden at the edges. They should remain soft.',
-            '10. Remove the cookies from the oven and allow them to cool completely on a rack.',
-            '11. Once the cookies are cool, spread dulce de leche on the flat side of one cookie and sandwich it with another.',
-            '12. If desired, roll the edges of the alfajores in powdered sugar, grated coconut, crushed nuts, or dip them in melted chocolate.',
-            '13. Allow any coatings to set before serving.',
-            '',
-            'Enjoy your homemade Uruguayan alfajores!',
-        ]
-    )
+    assert [line.strip() for line in result.output.splitlines()] == _EXPECTED_ALFAJOR_LINES
 
 
-async def test_openai_responses_reasoning_generate_summary(allow_model_requests: None, openai_api_key: str):
-    model = OpenAIResponsesModel('computer-use-preview', provider=OpenAIProvider(api_key=openai_api_key))
+async def test_openai_responses_reasoning_generate_summary(allow_model_requests: None, openai_provider: OpenAIProvider):
+    model = OpenAIResponsesModel('computer-use-preview', provider=openai_provider)
     agent = Agent(
         model=model,
         model_settings=OpenAIResponsesModelSettings(
@@ -155,21 +201,19 @@ Always follow local traffic rules and be cautious, even when crossing at a cross
 """)
 
 
-async def test_openai_responses_system_prompt(allow_model_requests: None, openai_api_key: str):
-    model = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
+async def test_openai_responses_system_prompt(allow_model_requests: None, model: OpenAIResponsesModel):
     agent = Agent(model=model, system_prompt='You are a helpful assistant.')
     result = await agent.run('What is the capital of France?')
     assert result.output == snapshot('The capital of France is Paris.')
 
 
-async def test_openai_responses_model_retry(allow_model_requests: None, openai_api_key: str):
-    model = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
+async def test_openai_responses_model_retry(allow_model_requests: None, model: OpenAIResponsesModel):
     agent = Agent(model=model)
 
     @agent.tool_plain
     async def get_location(loc_name: str) -> str:
         if loc_name == 'London':
-            return json.dumps({'lat': 51, 'lng': 0})
+            return to_json({'lat': 51, 'lng': 0}).decode()
         else:
             raise ModelRetry('Wrong location, I only know about "London".')
 
@@ -217,7 +261,7 @@ async def test_openai_responses_model_retry(allow_model_requests: None, openai_a
                     ),
                     ToolReturnPart(
                         tool_name='get_location',
-                        content='{"lat": 51, "lng": 0}',
+                        content='{"lat":51,"lng":0}',
                         tool_call_id=IsStr(),
                         timestamp=IsDatetime(),
                     ),
@@ -249,10 +293,9 @@ For **London**, it's located at approximately latitude 51° N and longitude 0°
 
 @pytest.mark.vcr()
 async def test_image_as_binary_content_tool_response(
-    allow_model_requests: None, image_content: BinaryContent, openai_api_key: str
+    allow_model_requests: None, image_content: BinaryContent, model: OpenAIResponsesModel
 ):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-    agent = Agent(m)
+    agent = Agent(model)
 
     @agent.tool_plain
     async def get_image() -> BinaryContent:
@@ -314,40 +357,26 @@ async def test_image_as_binary_content_tool_response(
     )
 
 
-async def test_image_as_binary_content_input(
-    allow_model_requests: None, image_content: BinaryContent, openai_api_key: str
-):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-    agent = Agent(m)
-
+async def test_image_as_binary_content_input(allow_model_requests: None, image_content: BinaryContent, agent: Agent):
     result = await agent.run(['What fruit is in the image?', image_content])
     assert result.output == snapshot('The fruit in the image is a kiwi.')
 
 
 async def test_openai_responses_audio_as_binary_content_input(
-    allow_model_requests: None, audio_content: BinaryContent, openai_api_key: str
+    allow_model_requests: None, audio_content: BinaryContent, agent: Agent
 ):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-    agent = Agent(m)
-
     with pytest.raises(NotImplementedError):
         await agent.run(['Whose name is mentioned in the audio?', audio_content])
 
 
 async def test_openai_responses_document_as_binary_content_input(
-    allow_model_requests: None, document_content: BinaryContent, openai_api_key: str
+    allow_model_requests: None, document_content: BinaryContent, agent: Agent
 ):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-    agent = Agent(m)
-
     result = await agent.run(['What is in the document?', document_content])
     assert result.output == snapshot('The document contains the text "Dummy PDF file."')
 
 
-async def test_openai_responses_document_url_input(allow_model_requests: None, openai_api_key: str):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-    agent = Agent(m)
-
+async def test_openai_responses_document_url_input(allow_model_requests: None, agent: Agent):
     document_url = DocumentUrl(url='https://www.w3.org/WAI/ER/tests/xhtml/testfiles/resources/pdf/dummy.pdf')
 
     result = await agent.run(['What is the main content on this document?', document_url])
@@ -356,10 +385,7 @@ async def test_openai_responses_document_url_input(allow_model_requests: None, o
     )
 
 
-async def test_openai_responses_text_document_url_input(allow_model_requests: None, openai_api_key: str):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-    agent = Agent(m)
-
+async def test_openai_responses_text_document_url_input(allow_model_requests: None, agent: Agent):
     text_document_url = DocumentUrl(url='https://example-files.online-convert.com/document/txt/example.txt')
 
     result = await agent.run(['What is the main content on this document?', text_document_url])
@@ -368,10 +394,7 @@ async def test_openai_responses_text_document_url_input(allow_model_requests: No
     )
 
 
-async def test_openai_responses_image_url_input(allow_model_requests: None, openai_api_key: str):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-    agent = Agent(m)
-
+async def test_openai_responses_image_url_input(allow_model_requests: None, agent: Agent):
     result = await agent.run(
         [
             'hello',
@@ -381,25 +404,21 @@ async def test_openai_responses_image_url_input(allow_model_requests: None, open
     assert result.output == snapshot("Hello! I see you've shared an image of a potato. How can I assist you today?")
 
 
-async def test_openai_responses_stream(allow_model_requests: None, openai_api_key: str):
-    model = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
+async def test_openai_responses_stream(allow_model_requests: None, model: OpenAIResponsesModel):
     agent = Agent(model=model)
 
     @agent.tool_plain
     async def get_capital(country: str) -> str:
         return 'Paris'
 
-    output_text: list[str] = []
     async with agent.run_stream('What is the capital of France?') as result:
-        async for output in result.stream_text():
-            output_text.append(output)
+        output_text = [output async for output in result.stream_text()]
 
     assert output_text == snapshot(['The capital of France is Paris.'])
 
 
-async def test_openai_responses_model_http_error(allow_model_requests: None, openai_api_key: str):
+async def test_openai_responses_model_http_error(allow_model_requests: None, model: OpenAIResponsesModel):
     """Set temperature to -1 to trigger an error, given only values between 0 and 1 are allowed."""
-    model = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
     agent = Agent(model=model, model_settings=OpenAIModelSettings(temperature=-1))
 
     with pytest.raises(ModelHTTPError):
@@ -407,8 +426,7 @@ async def test_openai_responses_model_http_error(allow_model_requests: None, ope
             ...  # pragma: lax no cover
 
 
-async def test_openai_responses_model_builtin_tools(allow_model_requests: None, openai_api_key: str):
-    model = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
+async def test_openai_responses_model_builtin_tools(allow_model_requests: None, model: OpenAIResponsesModel):
     settings = OpenAIResponsesModelSettings(openai_builtin_tools=[{'type': 'web_search_preview'}])
     agent = Agent(model=model, model_settings=settings)
     result = await agent.run('Give me the best news about LLMs from the last 24 hours. Be short.')
@@ -451,9 +469,8 @@ OpenAI's recent launch of GPT-5 has faced mixed reactions. Despite strong benchm
 
 
 @pytest.mark.vcr()
-async def test_openai_responses_model_instructions(allow_model_requests: None, openai_api_key: str):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-    agent = Agent(m, instructions='You are a helpful assistant.')
+async def test_openai_responses_model_instructions(allow_model_requests: None, model: OpenAIResponsesModel):
+    agent = Agent(model, instructions='You are a helpful assistant.')
 
     result = await agent.run('What is the capital of France?')
     assert result.all_messages() == snapshot(
@@ -478,9 +495,8 @@ async def test_openai_responses_model_instructions(allow_model_requests: None, o
     )
 
 
-async def test_openai_responses_model_web_search_tool(allow_model_requests: None, openai_api_key: str):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-    agent = Agent(m, instructions='You are a helpful assistant.', builtin_tools=[WebSearchTool()])
+async def test_openai_responses_model_web_search_tool(allow_model_requests: None, model: OpenAIResponsesModel):
+    agent = Agent(model, instructions='You are a helpful assistant.', builtin_tools=[WebSearchTool()])
 
     result = await agent.run('What day is it today?')
     assert result.output == snapshot("""\
@@ -502,11 +518,10 @@ Daily Forecast:
 
 
 async def test_openai_responses_model_web_search_tool_with_user_location(
-    allow_model_requests: None, openai_api_key: str
+    allow_model_requests: None, model: OpenAIResponsesModel
 ):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
     agent = Agent(
-        m,
+        model,
         instructions='You are a helpful assistant.',
         builtin_tools=[WebSearchTool(user_location={'city': 'Utrecht', 'region': 'NL'})],
     )
@@ -531,11 +546,10 @@ Daily Forecast:
 
 
 async def test_openai_responses_model_web_search_tool_with_invalid_region(
-    allow_model_requests: None, openai_api_key: str
+    allow_model_requests: None, model: OpenAIResponsesModel
 ):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
     agent = Agent(
-        m,
+        model,
         instructions='You are a helpful assistant.',
         builtin_tools=[WebSearchTool(user_location={'city': 'Salvador', 'region': 'BRLO'})],
     )
@@ -559,17 +573,15 @@ The forecast for today indicates partly cloudy skies with temperatures remaining
 """)
 
 
-async def test_openai_responses_model_web_search_tool_stream(allow_model_requests: None, openai_api_key: str):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-    agent = Agent(m, instructions='You are a helpful assistant.', builtin_tools=[WebSearchTool()])
+async def test_openai_responses_model_web_search_tool_stream(allow_model_requests: None, model: OpenAIResponsesModel):
+    agent = Agent(model, instructions='You are a helpful assistant.', builtin_tools=[WebSearchTool()])
 
     event_parts: list[Any] = []
     async with agent.iter(user_prompt='Give me the top 3 news in the world today.') as agent_run:
         async for node in agent_run:
             if Agent.is_model_request_node(node) or Agent.is_call_tools_node(node):
                 async with node.stream(agent_run.ctx) as request_stream:
-                    async for event in request_stream:
-                        event_parts.append(event)
+                    event_parts.extend([event async for event in request_stream])
 
     assert event_parts.pop(0) == snapshot(PartStartEvent(index=0, part=TextPart(content='Here')))
     assert event_parts.pop(0) == snapshot(FinalResultEvent(tool_name=None, tool_call_id=None))
@@ -592,26 +604,23 @@ Please note that news developments are continually evolving. For the most curren
 """)
 
 
-async def test_openai_responses_code_execution_tool(allow_model_requests: None, openai_api_key: str):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-    agent = Agent(m, instructions='You are a helpful assistant.', builtin_tools=[CodeExecutionTool()])
+async def test_openai_responses_code_execution_tool(allow_model_requests: None, model: OpenAIResponsesModel):
+    agent = Agent(model, instructions='You are a helpful assistant.', builtin_tools=[CodeExecutionTool()])
 
     result = await agent.run('What is 3 * 12390?')
     # NOTE: OpenAI doesn't return neither the `BuiltinToolCallPart` nor the `BuiltinToolReturnPart`.
     assert part_types_from_messages(result.all_messages()) == snapshot([[UserPromptPart], [TextPart]])
 
 
-async def test_openai_responses_code_execution_tool_stream(allow_model_requests: None, openai_api_key: str):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-    agent = Agent(m, instructions='You are a helpful assistant.', builtin_tools=[CodeExecutionTool()])
+async def test_openai_responses_code_execution_tool_stream(allow_model_requests: None, model: OpenAIResponsesModel):
+    agent = Agent(model, instructions='You are a helpful assistant.', builtin_tools=[CodeExecutionTool()])
 
     event_parts: list[Any] = []
     async with agent.iter(user_prompt='What is 3 * 12390?') as agent_run:
         async for node in agent_run:
             if Agent.is_model_request_node(node) or Agent.is_call_tools_node(node):
                 async with node.stream(agent_run.ctx) as request_stream:
-                    async for event in request_stream:
-                        event_parts.append(event)
+                    event_parts.extend([event async for event in request_stream])
 
     assert event_parts == snapshot(
         [
@@ -674,8 +683,8 @@ def test_model_profile_strict_not_supported():
 
 
 @pytest.mark.vcr()
-async def test_reasoning_model_with_temperature(allow_model_requests: None, openai_api_key: str):
-    m = OpenAIResponsesModel('o3-mini', provider=OpenAIProvider(api_key=openai_api_key))
+async def test_reasoning_model_with_temperature(allow_model_requests: None, openai_provider: OpenAIProvider):
+    m = OpenAIResponsesModel('o3-mini', provider=openai_provider)
     agent = Agent(m, model_settings=OpenAIResponsesModelSettings(temperature=0.5))
     result = await agent.run('What is the capital of Mexico?')
     assert result.output == snapshot(
@@ -684,18 +693,14 @@ async def test_reasoning_model_with_temperature(allow_model_requests: None, open
 
 
 @pytest.mark.vcr()
-async def test_tool_output(allow_model_requests: None, openai_api_key: str):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-
+async def test_tool_output(allow_model_requests: None, model: OpenAIResponsesModel):
     class CityLocation(BaseModel):
         city: str
         country: str
 
-    agent = Agent(m, output_type=ToolOutput(CityLocation))
+    agent = Agent(model, output_type=ToolOutput(CityLocation))
 
-    @agent.tool_plain
-    async def get_user_country() -> str:
-        return 'Mexico'
+    agent.tool_plain(get_user_country)
 
     result = await agent.run('What is the largest city in the user country?')
     assert result.output == snapshot(CityLocation(city='Mexico City', country='Mexico'))
@@ -765,17 +770,13 @@ async def test_tool_output(allow_model_requests: None, openai_api_key: str):
 
 
 @pytest.mark.vcr()
-async def test_text_output_function(allow_model_requests: None, openai_api_key: str):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-
+async def test_text_output_function(allow_model_requests: None, model: OpenAIResponsesModel):
     def upcase(text: str) -> str:
         return text.upper()
 
-    agent = Agent(m, output_type=TextOutput(upcase))
+    agent = Agent(model, output_type=TextOutput(upcase))
 
-    @agent.tool_plain
-    async def get_user_country() -> str:
-        return 'Mexico'
+    agent.tool_plain(get_user_country)
 
     result = await agent.run('What is the largest city in the user country?')
     assert result.output == snapshot('THE LARGEST CITY IN MEXICO IS MEXICO CITY.')
@@ -831,20 +832,16 @@ async def test_text_output_function(allow_model_requests: None, openai_api_key:
 
 
 @pytest.mark.vcr()
-async def test_native_output(allow_model_requests: None, openai_api_key: str):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-
+async def test_native_output(allow_model_requests: None, model: OpenAIResponsesModel):
     class CityLocation(BaseModel):
         """A city and its country."""
 
         city: str
         country: str
 
-    agent = Agent(m, output_type=NativeOutput(CityLocation))
+    agent = Agent(model, output_type=NativeOutput(CityLocation))
 
-    @agent.tool_plain
-    async def get_user_country() -> str:
-        return 'Mexico'
+    agent.tool_plain(get_user_country)
 
     result = await agent.run('What is the largest city in the user country?')
     assert result.output == snapshot(CityLocation(city='Mexico City', country='Mexico'))
@@ -898,9 +895,7 @@ async def test_native_output(allow_model_requests: None, openai_api_key: str):
 
 
 @pytest.mark.vcr()
-async def test_native_output_multiple(allow_model_requests: None, openai_api_key: str):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-
+async def test_native_output_multiple(allow_model_requests: None, model: OpenAIResponsesModel):
     class CityLocation(BaseModel):
         city: str
         country: str
@@ -909,11 +904,9 @@ async def test_native_output_multiple(allow_model_requests: None, openai_api_key
         country: str
         language: str
 
-    agent = Agent(m, output_type=NativeOutput([CityLocation, CountryLanguage]))
+    agent = Agent(model, output_type=NativeOutput([CityLocation, CountryLanguage]))
 
-    @agent.tool_plain
-    async def get_user_country() -> str:
-        return 'Mexico'
+    agent.tool_plain(get_user_country)
 
     result = await agent.run('What is the largest city in the user country?')
     assert result.output == snapshot(CityLocation(city='Mexico City', country='Mexico'))
@@ -971,18 +964,14 @@ async def test_native_output_multiple(allow_model_requests: None, openai_api_key
 
 
 @pytest.mark.vcr()
-async def test_prompted_output(allow_model_requests: None, openai_api_key: str):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-
+async def test_prompted_output(allow_model_requests: None, model: OpenAIResponsesModel):
     class CityLocation(BaseModel):
         city: str
         country: str
 
-    agent = Agent(m, output_type=PromptedOutput(CityLocation))
+    agent = Agent(model, output_type=PromptedOutput(CityLocation))
 
-    @agent.tool_plain
-    async def get_user_country() -> str:
-        return 'Mexico'
+    agent.tool_plain(get_user_country)
 
     result = await agent.run('What is the largest city in the user country?')
     assert result.output == snapshot(CityLocation(city='Mexico City', country='Mexico'))
@@ -1050,9 +1039,7 @@ Don't include any text or Markdown fencing before or after.\
 
 
 @pytest.mark.vcr()
-async def test_prompted_output_multiple(allow_model_requests: None, openai_api_key: str):
-    m = OpenAIResponsesModel('gpt-4o', provider=OpenAIProvider(api_key=openai_api_key))
-
+async def test_prompted_output_multiple(allow_model_requests: None, model: OpenAIResponsesModel):
     class CityLocation(BaseModel):
         city: str
         country: str
@@ -1061,11 +1048,9 @@ async def test_prompted_output_multiple(allow_model_requests: None, openai_api_k
         country: str
         language: str
 
-    agent = Agent(m, output_type=PromptedOutput([CityLocation, CountryLanguage]))
+    agent = Agent(model, output_type=PromptedOutput([CityLocation, CountryLanguage]))
 
-    @agent.tool_plain
-    async def get_user_country() -> str:
-        return 'Mexico'
+    agent.tool_plain(get_user_country)
 
     result = await agent.run('What is the largest city in the user country?')
     assert result.output == snapshot(CityLocation(city='Mexico City', country='Mexico'))
@@ -1,6 +1,6 @@
 from typing import Any
 
-from pydantic_ai.messages import ModelMessage, ModelRequestPart, ModelResponsePart
+from pydantic_ai.messages import ModelMessage
 
 
 def part_types_from_messages(messages: list[ModelMessage]) -> list[Any]:
@@ -26,10 +26,4 @@ def part_types_from_messages(messages: list[ModelMessage]) -> list[Any]:
 
     So each list represents either `ModelRequest` or `ModelResponse` and the parts that are present in the message.
     """
-    parts: list[Any] = []
-    for message in messages:
-        message_parts: list[type[ModelResponsePart | ModelRequestPart]] = []
-        for part in message.parts:
-            message_parts.append(type(part))
-        parts.append(message_parts)
-    return parts
+    return [[type(part) for part in message.parts] for message in messages]
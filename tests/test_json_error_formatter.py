@@ -14,81 +14,66 @@ from pydantic_ai._json_error_formatter import (
 )
 
 
-@pytest.mark.parametrize(
-    'test_case',
-    [
-        pytest.param(
-            {
-                'id': 'basic_unterminated_string',
-                'json_input': '{"key": "value"',
-                'is_mock': False,
-                'expected_lineno': 1,
-                'expected_error_line': '{"key": "value"',
-                'expected_lines': ['{"key": "value"'],
-            },
-            id='basic_unterminated_string',
-        ),
-        pytest.param(
-            {
-                'id': 'multiline_missing_comma',
-                'json_input': '{\n  "key": "value"\n  "missing_comma": true\n}',
-                'is_mock': False,
-                'expected_lineno': 3,
-                'expected_error_line': '  "missing_comma": true',
-                'expected_lines': ['{', '  "key": "value"', '  "missing_comma": true', '}'],
-            },
-            id='multiline_missing_comma',
-        ),
-        pytest.param(
-            {
-                'id': 'empty_document',
-                'json_input': '',
-                'is_mock': True,
-                'mock_msg': 'test error',
-                'mock_pos': 0,
-                'expected_lineno': 1,
-                'expected_error_line': '',
-                'expected_lines': [],
-            },
-            id='empty_document',
-        ),
-    ],
-)
-def test_extract_json_error_info(test_case: dict[str, Any]):
+def _decode_error(doc: str) -> json.JSONDecodeError:
+    """Parse invalid JSON and return the resulting decode error."""
+    try:
+        json.loads(doc)
+    except json.JSONDecodeError as e:
+        return e
+    else:  # pragma: no cover
+        raise AssertionError('Expected JSONDecodeError but parsing succeeded')
+
+
+def _extract_case(error: json.JSONDecodeError, lineno: int, error_line: str, preview: str, id: str):
+    """Build a `(error, expected)` parametrize case; message, position and column come from the error itself."""
+    expected = JsonErrorInfo(
+        msg=error.msg,
+        pos=error.pos,
+        lineno=lineno,
+        colno=error.colno,
+        error_line=error_line,
+        preview=preview,
+    )
+    return pytest.param(error, expected, id=id)
+
+
+# Built once at import so each test invocation just compares against a prebuilt JsonErrorInfo.
+_EXTRACT_CASES = [
+    _extract_case(
+        _decode_error('{"key": "value"'),
+        lineno=1,
+        error_line='{"key": "value"',
+        preview='{"key": "value"',
+        id='basic_unterminated_string',
+    ),
+    _extract_case(
+        _decode_error('{\n  "key": "value"\n  "missing_comma": true\n}'),
+        lineno=3,
+        error_line='  "missing_comma": true',
+        preview='{\n  "key": "value"\n  "missing_comma": true\n}',
+        id='multiline_missing_comma',
+    ),
+    _extract_case(
+        _decode_error('{"key": ' + 'x' * 1000 + '}'),
+        lineno=1,
+        error_line=('{"key": ' + 'x' * 1000)[:500],
+        preview=('{"key": ' + 'x' * 1000 + '}')[:500] + '...',
+        id='long_single_line_truncated',
+    ),
+    _extract_case(
+        json.JSONDecodeError('test error', '', 0),
+        lineno=1,
+        error_line='',
+        preview='N/A',
+        id='empty_document',
+    ),
+]
+
+
+@pytest.mark.parametrize('error,expected', _EXTRACT_CASES)
+def test_extract_json_error_info(error: json.JSONDecodeError, expected: JsonErrorInfo):
     """Test extraction of JSON error information from various scenarios."""
-    if test_case['is_mock']:
-        # Create a mock JSONDecodeError
-        error = json.JSONDecodeError(test_case['mock_msg'], test_case['json_input'], test_case['mock_pos'])
-        expected = JsonErrorInfo(
-            msg=test_case['mock_msg'],
-            pos=test_case['mock_pos'],
-            lineno=test_case['expected_lineno'],
-            colno=1,
-            doc=test_case['json_input'],
-            error_line=test_case['expected_error_line'],
-            lines=test_case['expected_lines'],
-        )
-    else:
-        # Parse real JSON to get actual error
-        try:
-            json.loads(test_case['json_input'])
-            pytest.fail('Expected JSONDecodeError but parsing succeeded')  # pragma: no cover
-        except json.JSONDecodeError as e:
-            # For real JSON errors, some values vary by implementation
-            expected = JsonErrorInfo(
-                msg=e.msg,  # Use actual message
-                pos=e.pos,  # Use actual position
-                lineno=test_case['expected_lineno'],
-                colno=e.colno,  # Use actual column
-                doc=test_case['json_input'],
-                error_line=test_case['expected_error_line'],
-                lines=test_case['expected_lines'],
-            )
-            error = e
-
-    error_info = extract_json_error_info(error)
-    assert isinstance(error_info.msg, str)  # Always check message is string
-    assert error_info == expected
+    assert extract_json_error_info(error) == expected
 
 
 @pytest.mark.parametrize(
@@ -101,9 +86,8 @@ def test_extract_json_error_info(test_case: dict[str, Any]):
                     pos=15,
                     lineno=1,
                     colno=16,
-                    doc='{"key": "value",}',
                     error_line='{"key": "value",}',
-                    lines=['{"key": "value",}'],
+                    preview='{"key": "value",}',
                 ),
                 'expected_contains': [
                     'JSON parsing error, line 1:',
@@ -123,9 +107,8 @@ def test_extract_json_error_info(test_case: dict[str, Any]):
                     pos=20,
                     lineno=2,
                     colno=5,
-                    doc='{\n  "ke',
                     error_line='  "ke',
-                    lines=['{', '  "ke'],
+                    preview='{\n  "ke',
                 ),
                 'expected_contains': ['JSON parsing error, line 2:', '  "ke', '^'],
                 'expected_caret_line': '    ' + ' ' * 4 + '^',
@@ -136,7 +119,7 @@ def test_extract_json_error_info(test_case: dict[str, Any]):
         pytest.param(
             {
                 'error_info': JsonErrorInfo(
-                    msg='No JSON object could be decoded', pos=0, lineno=1, colno=1, doc='', error_line='', lines=[]
+                    msg='No JSON object could be decoded', pos=0, lineno=1, colno=1, error_line='', preview='N/A'
                 ),
                 'expected_contains': [],
                 'expected_caret_line': None,
@@ -151,9 +134,8 @@ def test_extract_json_error_info(test_case: dict[str, Any]):
                     pos=5,
                     lineno=10,  # Invalid line number
                     colno=1,
-                    doc='short',
                     error_line='',
-                    lines=['short'],
+                    preview='short',
                 ),
                 'expected_contains': [],
                 'expected_caret_line': None,
@@ -251,7 +233,7 @@ def test_create_json_error_context_long_content():
 def test_caret_positioning(caret_position: int, expected_caret_line: str):
     """Test that caret is positioned correctly for different column positions."""
     error_info = JsonErrorInfo(
-        msg='Test error', pos=0, lineno=1, colno=caret_position, doc='x' * 20, error_line='x' * 20, lines=['x' * 20]
+        msg='Test error', pos=0, lineno=1, colno=caret_position, error_line='x' * 20, preview='x' * 20
     )
 
     formatted = format_json_error_visual(error_info)
@@ -259,3 +241,15 @@ def test_caret_positioning(caret_position: int, expected_caret_line: str):
     caret_line = next(line for line in lines if '^' in line)
 
     assert caret_line.rstrip() == expected_caret_line
+
+
+def test_caret_clamped_to_truncated_error_line():
+    """The caret is clamped to the displayed text when the column is past the truncated error line."""
+    long_doc = '{"key": ' + 'x' * 1000 + '}'
+    error = json.JSONDecodeError('Test error', long_doc, 810)
+
+    formatted = format_json_decode_error(error)
+    lines = formatted.split('\n')
+    caret_line = next(line for line in lines if '^' in line)
+
+    assert caret_line.rstrip() == '    ' + ' ' * 500 + '^'
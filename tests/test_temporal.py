@@ -51,6 +51,7 @@ try:
     from pydantic_ai.durable_exec.temporal._function_toolset import TemporalFunctionToolset
     from pydantic_ai.durable_exec.temporal._mcp_server import TemporalMCPServer
     from pydantic_ai.durable_exec.temporal._model import TemporalModel
+    from pydantic_ai.durable_exec.temporal._toolset import in_workflow, set_in_workflow
 except ImportError:  # pragma: lax no cover
     import pytest
 
@@ -1029,6 +1030,30 @@ async def test_temporal_agent():
     )
 
 
+def test_in_workflow_outside_agent_run():
+    """Outside `set_in_workflow` the context-local flag is unset, so the real Temporal probe is consulted."""
+    assert in_workflow() is False
+    with set_in_workflow():
+        assert in_workflow() is False
+    assert in_workflow() is False
+
+
+async def test_call_tool_activity_cached_across_temporalizations():
+    """Wrapping the same toolset again reuses the cached `call_tool_activity` definition."""
+    toolset = FunctionToolset[Deps](tools=[get_country], id='country')
+
+    def temporalize() -> TemporalFunctionToolset[Deps]:
+        return TemporalFunctionToolset(
+            toolset,
+            activity_name_prefix='agent__cache_test',
+            activity_config=BASE_ACTIVITY_CONFIG,
+            tool_activity_config={},
+            deps_type=Deps,
+        )
+
+    assert temporalize().call_tool_activity is temporalize().call_tool_activity
+
+
 async def test_temporal_agent_run(allow_model_requests: None):
     result = await simple_temporal_agent.run('What is the capital of Mexico?')
     assert result.output == snapshot('The capital of Mexico is Mexico City.')
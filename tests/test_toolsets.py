@@ -130,6 +130,61 @@ async def test_function_toolset():
     assert await bar_toolset.handle_call(ToolCallPart(tool_name='bar_add', args={'a': 1, 'b': 2})) == 3
 
 
+async def test_function_toolset_get_tool():
+    @dataclass
+    class PrefixDeps:
+        prefix: str | None = None
+
+    toolset = FunctionToolset[PrefixDeps]()
+
+    async def prepare_add_prefix(ctx: RunContext[PrefixDeps], tool_def: ToolDefinition) -> ToolDefinition | None:
+        if ctx.deps.prefix is None:
+            return tool_def
+
+        return replace(tool_def, name=f'{ctx.deps.prefix}_{tool_def.name}')
+
+    @toolset.tool(prepare=prepare_add_prefix)
+    def add(a: int, b: int) -> int:
+        """Add two numbers"""
+        return a + b
+
+    # Direct registry hit
+    no_prefix_context = build_run_context(PrefixDeps())
+    tool = await toolset.get_tool('add', no_prefix_context)
+    assert tool is not None
+    assert tool.tool_def.name == 'add'
+    assert tool == (await toolset.get_tools(no_prefix_context))['add']
+
+    # The tool was renamed by its `prepare` function, so it's only available under the new name
+    foo_context = build_run_context(PrefixDeps(prefix='foo'))
+    assert await toolset.get_tool('add', foo_context) is None
+    tool = await toolset.get_tool('foo_add', foo_context)
+    assert tool is not None
+    assert tool.tool_def.name == 'foo_add'
+
+    assert await toolset.get_tool('subtract', no_prefix_context) is None
+
+
+async def test_abstract_toolset_get_tool_default():
+    """Toolsets without their own registry fall back to the `get_tools`-based default `get_tool`."""
+    toolset = FunctionToolset[None]()
+
+    @toolset.tool
+    def add(a: int, b: int) -> int:
+        """Add two numbers"""
+        return a + b  # pragma: no cover
+
+    # PrefixedToolset doesn't override `get_tool`, so it uses the default implementation.
+    prefixed = PrefixedToolset(toolset, 'foo')
+    context = build_run_context(None)
+
+    tool = await prefixed.get_tool('foo_add', context)
+    assert tool is not None
+    assert tool.tool_def.name == 'foo_add'
+
+    assert await prefixed.get_tool('add', context) is None
+
+
 async def test_prepared_toolset_user_error_add_new_tools():
     """Test that PreparedToolset raises UserError when prepare function tries to add new tools."""
     context = build_run_context(None)
@@ -752,6 +807,63 @@ async def test_dynamic_toolset():
     assert tools == {}
 
 
+def test_dynamic_toolset_eq():
+    def toolset_func(ctx: RunContext[None]) -> None:
+        return None
+
+    toolset = DynamicToolset[None](toolset_func=toolset_func)
+
+    # Identity short-circuits before any field comparison
+    assert toolset == toolset
+
+    # Comparing against a different type falls back to `NotImplemented`
+    assert toolset != 'not a toolset'
+
+    assert toolset == DynamicToolset[None](toolset_func=toolset_func)
+    assert toolset != DynamicToolset[None](toolset_func=toolset_func, per_run_step=False)
+    assert toolset != DynamicToolset[None](toolset_func=lambda ctx: None)
+
+
+async def test_dynamic_toolset_sync_func_returning_awaitable():
+    """A sync `toolset_func` may still return an awaitable, which is awaited before use."""
+    inner = FunctionToolset[None]()
+
+    @inner.tool
+    def answer() -> str:
+        return 'hello'  # pragma: no cover
+
+    async def make_toolset(ctx: RunContext[None]) -> AbstractToolset[None]:
+        return inner
+
+    toolset = DynamicToolset[None](toolset_func=lambda ctx: make_toolset(ctx))
+
+    async with toolset:
+        tools = await toolset.get_tools(build_run_context(None))
+        assert tools.keys() == {'answer'}
+
+
+async def test_dynamic_toolset_tools_cache():
+    inner = FunctionToolset[None]()
+
+    @inner.tool
+    def answer() -> str:
+        return 'hello'  # pragma: no cover
+
+    toolset = DynamicToolset[None](toolset_func=lambda ctx: inner)
+
+    run_context = build_run_context(None)
+
+    async with toolset:
+        tools = await toolset.get_tools(run_context)
+        assert tools.keys() == {'answer'}
+
+        # Within the same run step the tools are served from cache, as the very same dict
+        assert await toolset.get_tools(run_context) is tools
+
+        # A new run step rebuilds the toolset and its tools
+        assert await toolset.get_tools(build_run_context(None, run_step=1)) is not tools
+
+
 async def test_dynamic_toolset_empty():
     def no_toolset_func(ctx: RunContext[None]) -> None:
         return None